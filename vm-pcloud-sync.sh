@@ -0,0 +1,34 @@
+#!/bin/sh
+# vm-pcloud-sync.sh
+# Zero-dependency fast path for the default vm_pcloud_sync.py run
+# (no Python startup; for cron/timers). Use the Python script for anything else.
+#
+# Env overrides: MODE=copy|sync  SRC=~/TradingHub  DEST=pcloud:TradingHub
+#                TRANSFERS=16  CHECKERS=32  STREAMS=8  STREAM_CUTOFF=64M
+# Extra args are passed straight to rclone (e.g. -n, --size-only).
+set -eu
+
+MODE="${MODE:-copy}"
+SRC="${SRC:-$HOME/TradingHub}"
+DEST="${DEST:-pcloud:TradingHub}"
+
+case "$MODE" in
+  copy|sync) ;;
+  *) echo "❌ MODE must be copy or sync (use vm_pcloud_sync.py for bisync)" >&2; exit 2 ;;
+esac
+[ -d "$SRC" ] || { echo "❌ Source not found or not a directory: $SRC" >&2; exit 1; }
+
+exec rclone "$MODE" "$SRC" "$DEST" \
+  -P --stats-one-line --stats 10s -v \
+  --transfers "${TRANSFERS:-16}" --checkers "${CHECKERS:-32}" --fast-list \
+  --multi-thread-streams "${STREAMS:-8}" --multi-thread-cutoff "${STREAM_CUTOFF:-64M}" \
+  --exclude '/**/.git/**' \
+  --exclude '/**/.venv/**' \
+  --exclude '/**/venv/**' \
+  --exclude '/**/__pycache__/**' \
+  --exclude '/**/.mypy_cache/**' \
+  --exclude '/**/.pytest_cache/**' \
+  --exclude '/**/*.pyc' \
+  --exclude '/**/*.pyo' \
+  --create-empty-src-dirs \
+  "$@"
@@ -8,22 +8,40 @@ Default run (no args):
 Options:
   --src ... (multi)      --dest ...        --mode copy|sync|bisync
   --dry-run              --fast            -v / -vv / -vvv
+  --preflight            (run `rclone about` on the remote first)
+  --size-only | --checksum               --no-traverse     --max-age DURATION
+  --since DURATION       (send only files changed locally within DURATION)
+  --local-walk           (pre-list local files, skipping excluded dirs; --files-from-raw)
+  --walk-threads N       (parallel local pre-walk; default 16)
+  --transfers N          --checkers N      (rclone parallelism; default 16 / 32)
+  --streams N            --stream-cutoff SIZE (per-file multi-thread; default 8 / 64M)
+  --jobs N               (sources synced concurrently; default min(#src, #CPU))
+  --merge                (combine sibling sources into one rclone copy)
   --no-default-excludes  --exclude PATTERN (repeatable)
   --include PATTERN      --snapshot        --name SUBDIR
   --resync (bisync only) --conflict-resolve newer|older|path1|path2|larger|smaller
+  --no-check-access (bisync only)
   --reverse / --pull     (flip direction: remote -> local)
 """
 
 import argparse
+import atexit
+import hashlib
 import os
+import re
 import shutil
 import subprocess
 import sys
-from pathlib import Path
-from datetime import datetime
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path, PurePosixPath
 
 # Built-in excludes (can be disabled via --no-default-excludes)
-DEFAULT_EXCLUDES = [
+DEFAULT_EXCLUDES = (
     "/**/.git/**",
     "/**/.venv/**",
     "/**/venv/**",
@@ -32,36 +50,441 @@ DEFAULT_EXCLUDES = [
     "/**/.pytest_cache/**",
     "/**/*.pyc",
     "/**/*.pyo",
-]
+)
+# ... and the matching rclone flags, flattened once at import
+_DEFAULT_EXCLUDE_ARGS = tuple(arg for pat in DEFAULT_EXCLUDES for arg in ("--exclude", pat))
+
+# Persistent state (bisync listings etc.)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "vm_pcloud_sync"
+
+# Same rules as set lookups, for the local pre-walk (--local-walk / --since)
+_SKIP_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", ".mypy_cache", ".pytest_cache"})
+_SKIP_SUFFIXES = (".pyc", ".pyo")
+
+# Above this many patterns, filters go to a --filter-from file instead of argv
+FILTER_FROM_THRESHOLD = 32
+
+# Serializes tagged output lines from parallel jobs
+_PRINT_LOCK = threading.Lock()
+
+# Temp files created by this run (cleaned up at exit)
+_TEMPFILES: list[str] = []
+
+def _is_exe(p: str) -> bool:
+    return os.path.isfile(p) and os.access(p, os.X_OK)
 
 def which_or_die(exe: str) -> str:
+    # explicit override ($RCLONE) wins; otherwise normal $PATH order
+    p = os.environ.get(exe.upper())
+    if p:
+        if not _is_exe(p):
+            print(f"❌ ${exe.upper()} is not an executable: {p}", file=sys.stderr)
+            sys.exit(2)
+        return p
+    # last $PATH lookup, cached per $PATH value and revalidated with one stat
+    cache = CACHE_DIR / f"{exe}_path"
+    path_env = os.environ.get("PATH", "")
+    try:
+        cached_path_env, p = cache.read_text(encoding="utf-8").split("\n")[:2]
+        if cached_path_env == path_env and _is_exe(p):
+            return p
+    except (OSError, ValueError):
+        pass
     p = shutil.which(exe)
     if not p:
         print(f"❌ {exe} not found. Install it first (e.g., `sudo apt-get install rclone`).", file=sys.stderr)
         sys.exit(2)
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(f"{path_env}\n{p}\n", encoding="utf-8")
+    except OSError:
+        pass
     return p
 
 def remote_name(dest: str) -> str | None:
     return dest.split(":", 1)[0] if ":" in dest else None
 
-def run(cmd: list[str]) -> int:
-    print("$ " + " ".join(cmd))
+def _emit(tag: str | None, msg: str, err: bool = False) -> None:
+    # with a tag (parallel jobs), prefix every line and write it in one go
+    stream = sys.stderr if err else sys.stdout
+    if tag is None:
+        print(msg, file=stream)
+        return
+    text = "".join(f"[{tag}] {line}\n" for line in msg.split("\n"))
+    with _PRINT_LOCK:
+        stream.write(text)
+        stream.flush()
+
+def run(cmd: list[str], tag: str | None = None, replace: bool = False) -> int:
+    _emit(tag, "$ " + " ".join(cmd))
+    if replace:
+        # hand the process over to rclone (no extra fork, clean SIGINT); never returns
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvp(cmd[0], cmd)
     try:
-        return subprocess.run(cmd).returncode
+        if tag is None:
+            return subprocess.run(cmd).returncode
+        # stream rclone's output line by line, prefixed with the job tag
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                _emit(tag, line.rstrip("\n"))
+            return proc.wait()
     except KeyboardInterrupt:
         return 130
 
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_DURATION_PART = re.compile(r"(\d+(?:\.\d*)?|\.\d+)([smhdw])")
+
+def parse_duration(text: str) -> float:
+    """Parse ``90s`` / ``30m`` / ``1h30m`` / ``7d`` / ``2w`` (bare number = seconds) into seconds."""
+    try:
+        secs = float(text)
+    except ValueError:
+        parts = _DURATION_PART.findall(text)
+        if not parts or "".join(num + unit for num, unit in parts) != text:
+            raise argparse.ArgumentTypeError(
+                f"invalid duration: {text!r} (e.g. 30m, 1h30m, 7d)") from None
+        secs = sum(float(num) * _DURATION_UNITS[unit] for num, unit in parts)
+    if not 0 < secs < float("inf"):
+        raise argparse.ArgumentTypeError(f"duration must be positive and finite: {text!r}")
+    return secs
+
+def _glob_regex(pat: str) -> str:
+    """Translate an rclone filter glob (``/`` anchor, ``**``, ``*``, ``?``, ``[..]``, ``{a,b}``) to a regex."""
+    def frag(body: str) -> str:
+        out: list[str] = []
+        i = 0
+        while i < len(body):
+            c = body[i]
+            if body.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            if c == "*":
+                out.append("[^/]*")
+            elif c == "?":
+                out.append("[^/]")
+            elif c == "\\" and i + 1 < len(body):
+                out.append(re.escape(body[i + 1]))
+                i += 1
+            elif c in "[{" and (j := body.find("]" if c == "[" else "}", i + 1)) != -1:
+                inner = body[i + 1:j]
+                if c == "[":
+                    neg = inner[:1] in ("!", "^")
+                    out.append("[" + ("^" if neg else "") + inner[neg:].replace("\\", "\\\\") + "]")
+                else:
+                    out.append("(?:" + "|".join(frag(alt) for alt in inner.split(",")) + ")")
+                i = j
+            else:
+                out.append(re.escape(c))
+            i += 1
+        return "".join(out)
+
+    # "/pat" is anchored at the transfer root; otherwise it matches at any depth
+    if pat.startswith("/"):
+        return "^/" + frag(pat[1:]) + "$"
+    return "(?:^|/)" + frag(pat) + "$"
+
+def compile_excludes(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Combine exclude globs into ONE regex, so each path costs a single match."""
+    regexes = [_glob_regex(pat) for pat in patterns]
+    return re.compile("|".join(f"(?:{r})" for r in regexes)) if regexes else None
+
+def _scan_dir(root: str, rel: str, prune: bool, cutoff: float | None,
+              skip: re.Pattern[str] | None = None) -> tuple[list[str], list[str]]:
+    """List one directory: (files, subdirs) as '/'-separated paths relative to root.
+
+    With ``prune=True`` the built-in excluded dirs and *.pyc/*.pyo are dropped by
+    name (scandir's d_type, no stat()); ``skip`` (see compile_excludes) drops
+    further dirs/files by path; with a cutoff, files are stat()ed and only those
+    modified after it are kept.
+    """
+    files: list[str] = []
+    dirs: list[str] = []
+    try:
+        it = os.scandir(os.path.join(root, rel) if rel else root)
+    except OSError:
+        return files, dirs
+    with it:
+        for entry in it:
+            name = entry.name
+            path = f"{rel}/{name}" if rel else name
+            if entry.is_dir(follow_symlinks=False):
+                if not (prune and name in _SKIP_DIRS) and not (skip and skip.search(f"/{path}/")):
+                    dirs.append(path)
+            elif prune and name.endswith(_SKIP_SUFFIXES):
+                continue
+            elif skip and skip.search(f"/{path}"):
+                continue
+            elif cutoff is None:
+                files.append(path)
+            else:
+                try:
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                except OSError:
+                    continue  # vanished since scandir (e.g. log rotation)
+                if mtime > cutoff:
+                    files.append(path)
+    return files, dirs
+
+def walk(root: str, prune: bool = True, cutoff: float | None = None,
+         skip: re.Pattern[str] | None = None) -> Iterator[str]:
+    """Yield every file under root (see _scan_dir), one directory at a time."""
+    todo = [""]
+    while todo:
+        files, dirs = _scan_dir(root, todo.pop(), prune, cutoff, skip)
+        todo.extend(dirs)
+        yield from files
+
+def parallel_scandir(root: str, prune: bool = True, cutoff: float | None = None,
+                     workers: int = 16, skip: re.Pattern[str] | None = None) -> Iterator[str]:
+    """Like walk(), but scans up to ``workers`` directories concurrently.
+
+    Directory listing and stat() are latency-bound (NFS, cloud block storage,
+    spinning disks), so threads overlap the waits. At most ``workers * 2`` scans
+    are in flight to bound memory.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        todo = [""]
+        running: set[Future] = set()
+        while todo or running:
+            while todo and len(running) < workers * 2:
+                running.add(ex.submit(_scan_dir, root, todo.pop(), prune, cutoff, skip))
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                files, dirs = fut.result()
+                todo.extend(dirs)
+                yield from files
+
+def list_local_files(src: str, args: argparse.Namespace) -> list[str]:
+    """Pre-walk a local source per --since / --walk-threads / --no-default-excludes.
+
+    Built-in excludes are applied by name (set lookup), user --exclude globs via one
+    combined regex. rclone checks --include rules before excludes, so with any
+    --include nothing is pre-filtered and rclone (which gets all filters) decides.
+    """
+    prune = not (args.no_default_excludes or args.include)
+    cutoff = time.time() - args.since if args.since else None
+    skip = None if args.include else compile_excludes(args.exclude)
+    if args.walk_threads > 1:
+        return list(parallel_scandir(src, prune, cutoff, args.walk_threads, skip))
+    return list(walk(src, prune, cutoff, skip))
+
+def bisync_compare(args: argparse.Namespace) -> str:
+    if args.size_only:
+        return "size"
+    if args.checksum:
+        return "size,checksum"
+    return "size,modtime"
+
+def bisync_workdir(path1: str, path2: str) -> Path:
+    key = hashlib.sha1(f"{path1}|{path2}".encode()).hexdigest()
+    return CACHE_DIR / "bisync" / key
+
+def write_tempfile(lines: Iterable[str], suffix: str) -> str:
+    """Write lines to a temp file that is removed when the wrapper exits; returns its path."""
+    with tempfile.NamedTemporaryFile("w", prefix="vm_pcloud_sync-", suffix=suffix,
+                                     delete=False, encoding="utf-8", errors="surrogateescape") as f:
+        f.writelines(f"{line}\n" for line in lines)
+    atexit.register(os.unlink, f.name)
+    _TEMPFILES.append(f.name)
+    return f.name
+
 def build_filter_args(use_defaults: bool, extra_excludes: list[str], extra_includes: list[str]) -> list[str]:
-    args: list[str] = []
-    if use_defaults:
-        for pat in DEFAULT_EXCLUDES:
-            args += ["--exclude", pat]
-    for pat in extra_excludes or []:
-        args += ["--exclude", pat]
-    for pat in extra_includes or []:
-        args += ["--include", pat]
+    defaults = DEFAULT_EXCLUDES if use_defaults else ()
+    excludes = extra_excludes or []
+    includes = extra_includes or []
+    if len(defaults) + len(excludes) + len(includes) > FILTER_FROM_THRESHOLD:
+        # long filter lists: one --filter-from file instead of thousands of argv entries
+        # same precedence as the flag form: rclone adds --include rules before --exclude
+        rules = [f"+ {pat}" for pat in includes] + [f"- {pat}" for pat in chain(defaults, excludes)]
+        if includes:
+            rules.append("- **")  # --include implies "exclude everything else"
+        return ["--filter-from", write_tempfile(rules, ".filter")]
+    args = list(_DEFAULT_EXCLUDE_ARGS) if use_defaults else []
+    args.extend(chain.from_iterable(("--exclude", pat) for pat in excludes))
+    args.extend(chain.from_iterable(("--include", pat) for pat in includes))
     return args
 
+def _run_one(s: str, args: argparse.Namespace, rclone: str, ts: str,
+             common: list[str], dest_root: str, nested: bool,
+             tagged: bool = False, replace: bool = False) -> int:
+    """Build and run the rclone command for one source; returns its exit code.
+
+    With ``nested=True`` the source maps to dest/<--name or source name>,
+    otherwise straight to dest.
+    With ``tagged=True`` output lines are prefixed with the source name (parallel jobs).
+    With ``replace=True`` the wrapper execs rclone in place and does not return.
+    """
+    # plain str paths: no Path objects per source (matters with hundreds of --src)
+    src_local = os.path.realpath(os.path.expanduser(s))
+    src_name = os.path.basename(src_local)
+    tag = src_name if tagged else None
+
+    # In normal (non-reverse) direction, we require local src to exist.
+    # In reverse mode (remote -> local), we will create local dest if missing.
+    if not args.reverse:
+        if not os.path.isdir(src_local):
+            _emit(tag, f"❌ Source not found or not a directory: {src_local}", err=True)
+            return 1
+    else:
+        # local target dir (dest in reverse) should exist; create if needed
+        try:
+            os.makedirs(src_local, exist_ok=True)
+        except Exception as e:
+            _emit(tag, f"❌ Cannot create local target directory: {src_local} ({e})", err=True)
+            return 1
+
+    base = (args.name or src_name) if nested else None
+
+    # Build forward (local->remote) and reverse (remote->local) paths
+    if not args.reverse:
+        # Forward: local src -> remote dest
+        forward_src = src_local
+        if base:
+            forward_dest = f"{dest_root}/{base}"
+        else:
+            forward_dest = dest_root
+        # snapshot applies only to copy/sync
+        if args.mode in ("copy", "sync") and args.snapshot:
+            forward_dest = f"{str(PurePosixPath(forward_dest)).rstrip('/')}-{ts}"
+        real_src, real_dest = forward_src, forward_dest
+        direction = "local -> remote"
+    else:
+        # Reverse: remote src -> local dest
+        if base:
+            reverse_src_remote = f"{dest_root}/{base}"
+        else:
+            reverse_src_remote = dest_root
+        reverse_dest_local = src_local
+        if args.mode in ("copy", "sync") and args.snapshot:
+            reverse_dest_local = f"{reverse_dest_local.rstrip('/')}-{ts}"
+            # ensure snapshot dir exists
+            os.makedirs(reverse_dest_local, exist_ok=True)
+        real_src, real_dest = reverse_src_remote, reverse_dest_local
+        direction = "remote -> local"
+
+    # local pre-walk: hand rclone the file list instead of letting it walk the tree
+    # (--since: only recently changed files, and skip the destination listing too)
+    delta: list[str] = []
+    if args.since or args.local_walk:  # main() rejects them outside local -> remote copy
+        files = list_local_files(real_src, args)
+        if not files:
+            _emit(tag, f"✅ Nothing to send from {real_src}\n")
+            return 0
+        delta = ["--files-from-raw", write_tempfile(files, ".files")]
+        if args.since:
+            delta.append("--no-traverse")
+
+    # assemble command
+    if args.mode in ("copy", "sync"):
+        cmd = [rclone, args.mode, real_src, real_dest, *common, *delta, "--create-empty-src-dirs"]
+    else:
+        # bisync: order matters if using conflict policy path1/path2; reverse flips the order
+        path1, path2 = (real_src, real_dest) if not args.reverse else (real_dest, real_src)
+        cmd = [
+            rclone, "bisync", path1, path2, *common,
+            *([] if args.no_check_access else ["--check-access"]),
+            "--compare", bisync_compare(args),
+            "--create-empty-src-dirs",
+            "--resilient",
+            "--recover",
+            "--conflict-resolve", args.conflict_resolve,
+        ]
+        if args.resync:
+            cmd.insert(2, "--resync")
+        workdir = bisync_workdir(path1, path2)
+        # use our own persistent state dir once it has a baseline (created by --resync);
+        # older baselines in rclone's default workdir keep working until then
+        # (a dry-run resync writes no listings, so it must not create the dir)
+        if args.resync and not args.dry_run:
+            workdir.mkdir(parents=True, exist_ok=True)
+        if workdir.is_dir():
+            cmd += ["--workdir", str(workdir)]
+
+    _emit(tag, f"\n=== {args.mode.upper()} ({direction}) ===\nSource : {real_src}\nDest   : {real_dest}\n")
+    # can't exec in place if a temp file must be cleaned up afterwards
+    rc = run(cmd, tag, replace and not _TEMPFILES)
+    if rc == 0:
+        _emit(tag, f"✅ Done: {real_src} → {real_dest}\n")
+    else:
+        _emit(tag, f"❌ Failed (rc={rc}): {real_src} → {real_dest}\n", err=True)
+    return rc
+
+def _run_merged(srcs: list[str], args: argparse.Namespace, rclone: str,
+                common: list[str], dest_root: str) -> int:
+    """Copy sibling sources to dest_root/<name> in ONE rclone run via --files-from-raw.
+
+    Same layout as one run per source, but rclone starts, authenticates and lists
+    the remote once. ``common`` must not carry the filter flags: rclone's root is
+    the sources' parent here, so anchored rules would match differently; the
+    per-source pre-walk has already applied the excludes instead.
+    """
+    root = os.path.dirname(srcs[0])
+    files: list[str] = []
+    for src in srcs:
+        name = os.path.basename(src)
+        files.extend(f"{name}/{path}" for path in list_local_files(src, args))
+    names = ", ".join(os.path.basename(src) for src in srcs)
+    if not files:
+        print(f"✅ Nothing to send from {root} ({names})\n")
+        return 0
+
+    cmd = [rclone, "copy", root, dest_root, *common, "--files-from-raw", write_tempfile(files, ".files")]
+    if args.since:
+        cmd.append("--no-traverse")
+    cmd.append("--create-empty-src-dirs")
+
+    print(f"\n=== COPY (local -> remote, {len(srcs)} sources in one run) ===\n"
+          f"Source : {root}/{{{names}}}\nDest   : {dest_root}\n")
+    rc = run(cmd)
+    if rc == 0:
+        print(f"✅ Done: {root}/{{{names}}} → {dest_root}\n")
+    else:
+        print(f"❌ Failed (rc={rc}): {root}/{{{names}}} → {dest_root}\n", file=sys.stderr)
+    return rc
+
+def _run_single_root(s: str, args: argparse.Namespace, rclone: str, ts: str,
+                     common: list[str], dest_root: str) -> int:
+    """One source, no --name: rclone writes straight into dest, exec'd in place."""
+    return _run_one(s, args, rclone, ts, common, dest_root, nested=False, replace=True)
+
+def _run_multi_nested(srcs: list[str], args: argparse.Namespace, rclone: str, ts: str,
+                      common: list[str], filters: list[str], dest_root: str, jobs: int) -> int:
+    """Each source goes to dest/<name>; returns the worst exit code.
+
+    With --merge, sibling sources are combined into one rclone run where possible;
+    otherwise there is one run per source (concurrent with ``jobs > 1``).
+    """
+    # opt-in: plain multi-source copy of sibling dirs as one rclone session instead of N
+    # (not with --include: rclone's root becomes the parent, so anchored includes break)
+    if args.merge and args.mode == "copy" and not (args.reverse or args.name or args.snapshot
+                                                   or args.include):
+        paths = list(dict.fromkeys(os.path.realpath(os.path.expanduser(s)) for s in srcs))
+        found = [p for p in paths if os.path.isdir(p)]
+        if found and len({os.path.dirname(p) for p in found}) == 1:
+            missing = [p for p in paths if p not in found]
+            for p in missing:
+                print(f"❌ Source not found or not a directory: {p}", file=sys.stderr)
+            rc = _run_merged(found, args, rclone, common, dest_root)
+            return max(rc, 1) if missing else rc
+
+    common = [*common, *filters]
+    if len(srcs) == 1:
+        # single source with --name: still nothing to do afterwards, exec in place
+        return _run_one(srcs[0], args, rclone, ts, common, dest_root, nested=True, replace=True)
+    if jobs == 1:
+        return max(_run_one(s, args, rclone, ts, common, dest_root, nested=True) for s in srcs)
+
+    # independent source trees -> run rclone concurrently (I/O-bound, threads suffice);
+    # output is streamed with a [source] prefix on every line
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        futs = [ex.submit(_run_one, s, args, rclone, ts, common, dest_root, nested=True, tagged=True)
+                for s in srcs]
+        return max(fut.result() for fut in as_completed(futs))
+
 def main():
     ap = argparse.ArgumentParser(description="VM ⇄ pCloud sync via rclone (copy/sync/bisync).")
     # ✅ defaults so running with NO ARGS works as requested
@@ -78,7 +501,42 @@ def main():
     ap.add_argument("--snapshot", action="store_true",
                     help="For copy/sync: write into a timestamped subfolder.")
     ap.add_argument("--dry-run", action="store_true", help="Do not modify, just show actions.")
-    ap.add_argument("--fast", action="store_true", help="Use --fast-list.")
+    ap.add_argument("--preflight", action="store_true",
+                    help="Run `rclone about <remote>:` before syncing (sanity check).")
+    ap.add_argument("--fast", action="store_true",
+                    help="Use --fast-list (always on when --dest is a remote).")
+    ap.add_argument("--transfers", type=int, default=16,
+                    help="Parallel file transfers (rclone default is 4). Default: 16")
+    ap.add_argument("--checkers", type=int, default=32,
+                    help="Parallel checkers (rclone default is 8). Default: 32")
+    ap.add_argument("--streams", type=int, default=8,
+                    help="Parallel streams per large file (--multi-thread-streams). Default: 8")
+    ap.add_argument("--stream-cutoff", default="64M", metavar="SIZE",
+                    help="Use multi-thread transfers above this size. Default: 64M")
+    ap.add_argument("--merge", action="store_true",
+                    help="Multi-source copy: one combined --files-from-raw run for sibling "
+                         "dirs instead of one rclone run per source.")
+    ap.add_argument("--jobs", "-j", type=int, default=None,
+                    help="Sources to sync concurrently. Default: min(#src, #CPU)")
+    # incremental fast paths (typical: first run without, later runs with)
+    cmp = ap.add_mutually_exclusive_group()
+    cmp.add_argument("--size-only", action="store_true",
+                     help="Compare by size only (skip modtime/hash checks).")
+    cmp.add_argument("--checksum", action="store_true",
+                     help="Compare by size + hash instead of modtime.")
+    ap.add_argument("--no-traverse", action="store_true",
+                    help="copy only: don't list the whole destination (few changed files).")
+    ap.add_argument("--max-age", default=None, metavar="DURATION",
+                    help="Only consider files newer than this (e.g. 24h, 7d).")
+    ap.add_argument("--since", type=parse_duration, default=None, metavar="DURATION",
+                    help="copy (local -> remote): only send files modified within "
+                         "DURATION (units s/m/h/d/w, compounds like 1h30m); "
+                         "uses --files-from-raw + --no-traverse.")
+    ap.add_argument("--local-walk", action="store_true",
+                    help="copy (local -> remote): list files locally (skipping excluded "
+                         "dirs) and pass them to rclone via --files-from-raw.")
+    ap.add_argument("--walk-threads", type=int, default=16,
+                    help="Threads for the local pre-walk (--since/--local-walk). Default: 16")
     ap.add_argument("--verbose", "-v", action="count", default=1,
                     help="Increase verbosity (-v/-vv/-vvv).")
     ap.add_argument("--no-default-excludes", action="store_true",
@@ -90,109 +548,57 @@ def main():
     # bisync-only
     ap.add_argument("--resync", action="store_true",
                     help="bisync baseline (use ONCE on first run).")
+    ap.add_argument("--no-check-access", action="store_true",
+                    help="bisync: skip the RCLONE_TEST access check (faster).")
     ap.add_argument("--conflict-resolve", default="newer",
                     choices=["none","newer","older","path1","path2","larger","smaller"],
                     help="bisync conflict policy. Default: newer")
     args = ap.parse_args()
+    # a --files-from list hides local deletions from sync, so only copy makes sense
+    if args.since and (args.reverse or args.mode != "copy"):
+        ap.error("--since only works for copy in the local -> remote direction")
+    if args.local_walk and (args.reverse or args.mode != "copy"):
+        ap.error("--local-walk only works for copy in the local -> remote direction")
 
     rclone = which_or_die("rclone")
 
-    # quick remote sanity check (if dest is a remote)
+    # optional remote sanity check (a full round-trip to pCloud, so opt-in)
     rn = remote_name(args.dest)
-    if rn:
+    if rn and args.preflight:
         run([rclone, "about", f"{rn}:"])
 
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime("%Y%m%d_%H%M%S", time.localtime())
     vflags = ["-v"] * max(1, min(args.verbose, 3))
     common = ["-P", "--stats-one-line", "--stats", "10s"] + vflags
+    # pCloud is latency-bound: more parallel transfers/checkers ≈ linear speedup
+    common += ["--transfers", str(args.transfers), "--checkers", str(args.checkers)]
+    # ... and split large files into parallel range requests
+    common += ["--multi-thread-streams", str(args.streams), "--multi-thread-cutoff", args.stream_cutoff]
     if args.dry_run:
         common += ["-n"]
-    if args.fast:
+    if args.fast or rn:
         common += ["--fast-list"]
+    # (bisync gets the equivalent via --compare, see bisync_compare)
+    if args.mode != "bisync" and args.size_only:
+        common += ["--size-only"]
+    elif args.mode != "bisync" and args.checksum:
+        common += ["--checksum"]
+    # rclone ignores --no-traverse with sync and logs an ERROR about it
+    if args.no_traverse and args.mode == "copy":
+        common += ["--no-traverse"]
+    if args.max_age:
+        common += ["--max-age", args.max_age]
+    # filters (same for every source, so built once)
+    filters = build_filter_args(not args.no_default_excludes, args.exclude, args.include)
 
-    multi_src = len(args.src) > 1
-
-    for s in args.src:
-        src_local = Path(os.path.expanduser(s)).resolve()
-
-        # In normal (non-reverse) direction, we require local src to exist.
-        # In reverse mode (remote -> local), we will create local dest if missing.
-        if not args.reverse:
-            if not src_local.is_dir():
-                print(f"❌ Source not found or not a directory: {src_local}", file=sys.stderr)
-                continue
-        else:
-            # local target dir (dest in reverse) should exist; create if needed
-            try:
-                src_local.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                print(f"❌ Cannot create local target directory: {src_local} ({e})", file=sys.stderr)
-                continue
+    dest_root = args.dest.rstrip("/")
+    jobs = max(1, args.jobs or min(len(args.src), os.cpu_count() or 1))
 
-        dest_root = args.dest.rstrip("/")
-
-        # decide a base name for nesting when needed
-        if args.name:
-            base = args.name
-        elif multi_src:
-            base = src_local.name
-        else:
-            base = None  # single source, no forced nesting
-
-        # Build forward (local->remote) and reverse (remote->local) paths
-        if not args.reverse:
-            # Forward: local src -> remote dest
-            forward_src = str(src_local)
-            if base:
-                forward_dest = f"{dest_root}/{base}"
-            else:
-                forward_dest = dest_root
-            # snapshot applies only to copy/sync
-            if args.mode in ("copy", "sync") and args.snapshot:
-                forward_dest = f"{Path(forward_dest).as_posix().rstrip('/')}-{ts}"
-            real_src, real_dest = forward_src, forward_dest
-            direction = "local -> remote"
-        else:
-            # Reverse: remote src -> local dest
-            if base:
-                reverse_src_remote = f"{dest_root}/{base}"
-            else:
-                reverse_src_remote = dest_root
-            reverse_dest_local = str(src_local)
-            if args.mode in ("copy", "sync") and args.snapshot:
-                reverse_dest_local = f"{Path(reverse_dest_local).as_posix().rstrip('/')}-{ts}"
-                # ensure snapshot dir exists
-                Path(reverse_dest_local).mkdir(parents=True, exist_ok=True)
-            real_src, real_dest = reverse_src_remote, reverse_dest_local
-            direction = "remote -> local"
-
-        # filters
-        fx = build_filter_args(not args.no_default_excludes, args.exclude, args.include)
-
-        # assemble command
-        if args.mode in ("copy", "sync"):
-            cmd = [rclone, args.mode, real_src, real_dest] + common + fx + ["--create-empty-src-dirs"]
-        else:
-            # bisync: order matters if using conflict policy path1/path2; reverse flips the order
-            path1, path2 = (real_src, real_dest) if not args.reverse else (real_dest, real_src)
-            cmd = [rclone, "bisync", path1, path2] + common + fx + [
-                "--check-access",
-                "--compare", "size,modtime",
-                "--create-empty-src-dirs",
-                "--resilient",
-                "--recover",
-                "--conflict-resolve", args.conflict_resolve,
-            ]
-            if args.resync:
-                cmd.insert(2, "--resync")
-
-        print(f"\n=== {args.mode.upper()} ({direction}) ===\nSource : {real_src}\nDest   : {real_dest}\n")
-        rc = run(cmd)
-        if rc == 0:
-            print(f"✅ Done: {real_src} → {real_dest}\n")
-        else:
-            print(f"❌ Failed (rc={rc}): {real_src} → {real_dest}\n", file=sys.stderr)
+    # partition once: single source straight into dest vs. per-source subfolders
+    dest_layout = "root" if (len(args.src) == 1 and not args.name) else "nested"
+    if dest_layout == "root":
+        sys.exit(_run_single_root(args.src[0], args, rclone, ts, [*common, *filters], dest_root))
+    sys.exit(_run_multi_nested(args.src, args, rclone, ts, common, filters, dest_root, jobs))
 
 if __name__ == "__main__":
     main()
-